@@ -379,6 +379,20 @@ class Phono3py(object):
     def mesh_numbers(self):
         return self._mesh_numbers
 
+    @mesh_numbers.setter
+    def mesh_numbers(self, mesh_numbers):
+        """Set sampling mesh
+
+        mesh_numbers is given as three integers or a length, as the mesh
+        parameter of Phono3py. Since ph-ph interaction depends on the
+        mesh, the interaction set previously is discarded and has to be
+        set again by set_phph_interaction.
+
+        """
+
+        self._set_mesh_numbers(mesh_numbers)
+        self._interaction = None
+
     @property
     def thermal_conductivity(self):
         return self._thermal_conductivity
@@ -1011,6 +1025,7 @@ class Phono3py(object):
             _fc3 = self._fc3
         else:
             _fc3 = fc3
+        self._check_fc3_writable(_fc3)
         cutoff_fc3_by_zero(_fc3,  # overwritten
                            self._supercell,
                            cutoff_distance,
@@ -1020,12 +1035,14 @@ class Phono3py(object):
         if self._fc2 is not None:
             set_permutation_symmetry(self._fc2)
         if self._fc3 is not None:
+            self._check_fc3_writable(self._fc3)
             set_permutation_symmetry_fc3(self._fc3)
 
     def set_translational_invariance(self):
         if self._fc2 is not None:
             set_translational_invariance(self._fc2)
         if self._fc3 is not None:
+            self._check_fc3_writable(self._fc3)
             set_translational_invariance_fc3(self._fc3)
 
     def run_imag_self_energy(self,
@@ -1376,6 +1393,20 @@ class Phono3py(object):
              self._phonon_primitive.get_supercell_to_primitive_map()]]
         self._phonon_supercell.set_masses(s_masses)
 
+    def _check_fc3_writable(self, fc3):
+        # fc3 is overwritten in C as a double array. numpy.memmap and
+        # h5py.Dataset given by phono3py.load(lazy_fc=True), and fc3 read
+        # with fc_dtype='single' must not be passed.
+        if (type(fc3) != np.ndarray or
+            not fc3.flags.writeable or
+            fc3.dtype != np.dtype('double') or
+            not fc3.flags.c_contiguous):
+            msg = ("fc3 has to be writable numpy ndarray of dtype='double' "
+                   "and c_contiguous to be modified. fc3 read with "
+                   "lazy_fc=True or fc_dtype other than 'double' can not "
+                   "be modified.")
+            raise TypeError(msg)
+
     def _set_mesh_numbers(self, mesh):
         _mesh = np.array(mesh)
         mesh_nums = None
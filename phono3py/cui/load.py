@@ -33,13 +33,19 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import copy
+from functools import lru_cache
 import numpy as np
+import h5py
 from phono3py import Phono3py
 from phono3py.cui.phono3py_yaml import Phono3pyYaml
 from phono3py.file_IO import read_fc3_from_hdf5, read_fc2_from_hdf5
 from phonopy.interface.calculator import get_default_physical_units
 import phonopy.cui.load_helper as load_helper
 
+# Key made by _get_ph3py_core_key -> Phono3py instance without mesh
+_ph3py_core_cache = {}
+
 
 def load(phono3py_yaml=None,  # phono3py.yaml-like must be the first argument.
          supercell_matrix=None,
@@ -64,6 +70,9 @@ def load(phono3py_yaml=None,  # phono3py.yaml-like must be the first argument.
          is_symmetry=True,
          is_mesh_symmetry=True,
          symprec=1e-5,
+         lazy_fc=False,
+         fc_dtype='double',
+         use_cache=False,
          log_level=0):
     """Create Phono3py instance from parameters and/or input files.
 
@@ -175,6 +184,33 @@ def load(phono3py_yaml=None,  # phono3py.yaml-like must be the first argument.
         Default is True.
     symprec : float, optional
         Tolerance used to find crystal symmetry. Default is 1e-5.
+    lazy_fc : bool, optional
+        If True, fc3 read from hdf5 file is not loaded into memory. Instead
+        a read-only numpy.memmap (contiguous dataset) or h5py.Dataset
+        (chunked dataset) is set as fc3, and the data are read when
+        they are accessed. Such fc3 is read-only, and methods that
+        modify fc3 in place, e.g., Phono3py.set_permutation_symmetry,
+        raise TypeError. Note that fc3 is loaded into memory anyway
+        when ph-ph interaction is set up, e.g., by giving mesh.
+        Default is False.
+    fc_dtype : str or numpy.dtype, optional
+        dtype of fc3 read from hdf5 file. With 'single', the data are
+        converted while reading and the memory used for fc3 is halved.
+        Note that fc3 is converted to double when ph-ph interaction is
+        set up, and that methods modifying fc3 in place, e.g.,
+        Phono3py.set_permutation_symmetry, raise TypeError unless fc3 is
+        double. With lazy_fc=True, fc_dtype has to agree with the dtype
+        stored in the file, otherwise ValueError is raised. Default is
+        'double'.
+    use_cache : bool, optional
+        If True, Phono3py instance built in the last load() call with
+        use_cache=True is reused when all the inputs except for mesh,
+        NAC, and frequency_scale_factor are the same and the force
+        constants files are unchanged. A shallow copy of it is returned,
+        i.e., cells and force constants arrays are shared among the
+        returned instances and must not be modified in place. The parsed
+        phono3py_yaml file is also reused while it is unchanged. The
+        cached data are released by clear_load_cache(). Default is False.
     log_level : int, optional
         Verbosity control. Default is 0.
 
@@ -201,8 +237,13 @@ def load(phono3py_yaml=None,  # phono3py.yaml-like must be the first argument.
 
         _nac_params = nac_params
     else:
-        ph3py_yaml = Phono3pyYaml()
-        ph3py_yaml.read(phono3py_yaml)
+        if use_cache:
+            # Deep copy is returned not to share objects among instances.
+            ph3py_yaml = copy.deepcopy(_read_phono3py_yaml(
+                os.path.abspath(phono3py_yaml), *_stat_key(phono3py_yaml)))
+        else:
+            ph3py_yaml = Phono3pyYaml()
+            ph3py_yaml.read(phono3py_yaml)
         cell = ph3py_yaml.unitcell
         smat = ph3py_yaml.supercell_matrix
         ph_smat = ph3py_yaml.phonon_supercell_matrix
@@ -224,36 +265,156 @@ def load(phono3py_yaml=None,  # phono3py.yaml-like must be the first argument.
     else:
         _factor = factor
 
+    # Type of mesh is checked before force constants are read.
+    if mesh is not None and np.array(mesh).shape not in ((), (3, )):
+        msg = "mesh has inappropriate type."
+        raise TypeError(msg)
+
+    core_kwargs = dict(cell=cell,
+                       smat=smat,
+                       pmat=pmat,
+                       ph_smat=ph_smat,
+                       factor=_factor,
+                       symprec=symprec,
+                       is_symmetry=is_symmetry,
+                       is_mesh_symmetry=is_mesh_symmetry,
+                       calculator=calculator,
+                       log_level=log_level,
+                       fc3_filename=fc3_filename,
+                       fc2_filename=fc2_filename,
+                       forces_fc3_filename=forces_fc3_filename,
+                       forces_fc2_filename=forces_fc2_filename,
+                       fc_calculator=fc_calculator,
+                       lazy_fc=lazy_fc,
+                       fc_dtype=fc_dtype)
+    if use_cache:
+        key = _get_ph3py_core_key(**core_kwargs)
+        if key not in _ph3py_core_cache:
+            _ph3py_core_cache.clear()
+            _ph3py_core_cache[key] = _build_ph3py_core(**core_kwargs)
+        ph3py = copy.copy(_ph3py_core_cache[key])
+    else:
+        ph3py = _build_ph3py_core(**core_kwargs)
+
+    if mesh is not None:
+        ph3py.mesh_numbers = mesh
+
+    _nac_params = load_helper.get_nac_params(ph3py.primitive,
+                                             _nac_params,
+                                             born_filename,
+                                             is_nac,
+                                             units['nac_factor'])
+
+    if mesh is not None:
+        ph3py.set_phph_interaction(
+            nac_params=_nac_params,
+            frequency_scale_factor=frequency_scale_factor)
+
+    return ph3py
+
+
+def clear_load_cache():
+    """Release data cached by load(use_cache=True)
+
+    Phono3py instance with force constants and parsed phono3py.yaml-like
+    file kept for reuse are released. Instances already returned by
+    load() are not affected.
+
+    """
+
+    _ph3py_core_cache.clear()
+    _read_phono3py_yaml.cache_clear()
+
+
+def _build_ph3py_core(cell=None,
+                      smat=None,
+                      pmat=None,
+                      ph_smat=None,
+                      factor=None,
+                      symprec=1e-5,
+                      is_symmetry=True,
+                      is_mesh_symmetry=True,
+                      calculator=None,
+                      log_level=0,
+                      fc3_filename=None,
+                      fc2_filename=None,
+                      forces_fc3_filename=None,
+                      forces_fc2_filename=None,
+                      fc_calculator=None,
+                      lazy_fc=False,
+                      fc_dtype='double'):
+    """Create Phono3py instance with force constants but without mesh"""
+
     ph3py = Phono3py(cell,
                      smat,
                      primitive_matrix=pmat,
                      phonon_supercell_matrix=ph_smat,
-                     mesh=mesh,
-                     frequency_factor_to_THz=_factor,
+                     frequency_factor_to_THz=factor,
                      symprec=symprec,
                      is_symmetry=is_symmetry,
                      is_mesh_symmetry=is_mesh_symmetry,
                      calculator=calculator,
                      log_level=log_level)
-    _nac_params = load_helper.get_nac_params(ph3py.primitive,
-                                             _nac_params,
-                                             born_filename,
-                                             is_nac,
-                                             units['nac_factor'])
     _set_force_constants(ph3py,
                          dataset=None,
                          fc3_filename=fc3_filename,
                          fc2_filename=fc2_filename,
                          forces_fc3_filename=forces_fc3_filename,
                          forces_fc2_filename=forces_fc2_filename,
-                         fc_calculator=fc_calculator)
+                         fc_calculator=fc_calculator,
+                         lazy_fc=lazy_fc,
+                         fc_dtype=fc_dtype)
+    return ph3py
 
-    if mesh is not None:
-        ph3py.set_phph_interaction(
-            nac_params=_nac_params,
-            frequency_scale_factor=frequency_scale_factor)
 
-    return ph3py
+def _get_ph3py_core_key(cell=None,
+                        smat=None,
+                        pmat=None,
+                        ph_smat=None,
+                        fc3_filename=None,
+                        fc2_filename=None,
+                        forces_fc3_filename=None,
+                        forces_fc2_filename=None,
+                        **kwargs):
+    """Return hashable key of inputs of _build_ph3py_core
+
+    Files of force constants are identified by their absolute paths,
+    modification times, and sizes.
+
+    """
+
+    fc_files = []
+    for filename in _get_fc_filenames(
+            fc3_filename=fc3_filename,
+            fc2_filename=fc2_filename,
+            forces_fc3_filename=forces_fc3_filename,
+            forces_fc2_filename=forces_fc2_filename):
+        if filename is None:
+            fc_files.append(None)
+        else:
+            fc_files.append((os.path.abspath(filename), ) +
+                            _stat_key(filename))
+
+    cell_key = tuple(_array_key(v) for v in (cell.get_cell(),
+                                             cell.get_scaled_positions(),
+                                             cell.get_atomic_numbers(),
+                                             cell.get_masses(),
+                                             cell.get_magnetic_moments()))
+    return (cell_key,
+            _array_key(smat),
+            _array_key(pmat),
+            _array_key(ph_smat),
+            tuple(fc_files),
+            forces_fc3_filename,
+            forces_fc2_filename,
+            tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+
+
+def _array_key(a):
+    if a is None or isinstance(a, str):
+        return a
+    _a = np.array(a)
+    return (_a.dtype.str, _a.shape, _a.tobytes())
 
 
 def _set_force_constants(
@@ -263,24 +424,164 @@ def _set_force_constants(
         fc2_filename=None,
         forces_fc3_filename=None,
         forces_fc2_filename=None,
-        fc_calculator=None):
-    p2s_map = ph3py.primitive.p2s_map
+        fc_calculator=None,
+        lazy_fc=False,
+        fc_dtype='double'):
+    # The same array is passed to all the readers below.
+    p2s_map = np.array(ph3py.primitive.p2s_map, dtype='intc')
+
+    _fc3_filename, _fc2_filename = _get_fc_filenames(
+        fc3_filename=fc3_filename,
+        fc2_filename=fc2_filename,
+        forces_fc3_filename=forces_fc3_filename,
+        forces_fc2_filename=forces_fc2_filename)
+
+    if (_fc3_filename is not None and
+        _fc2_filename is not None and
+        os.path.abspath(_fc3_filename) == os.path.abspath(_fc2_filename)):
+        ph3py.fc3, ph3py.fc2 = _read_fc3_and_fc2_from_hdf5(_fc3_filename,
+                                                           p2s_map,
+                                                           lazy=lazy_fc,
+                                                           dtype=fc_dtype)
+        return
+
+    if _fc3_filename is not None:
+        ph3py.fc3 = _read_fc3_from_hdf5(_fc3_filename,
+                                        p2s_map,
+                                        lazy=lazy_fc,
+                                        dtype=fc_dtype)
+    if _fc2_filename is not None:
+        ph3py.fc2 = read_fc2_from_hdf5(filename=_fc2_filename,
+                                       p2s_map=p2s_map)
+
+
+def _get_fc_filenames(fc3_filename=None,
+                      fc2_filename=None,
+                      forces_fc3_filename=None,
+                      forces_fc2_filename=None):
+    """Return names of fc3 and fc2 hdf5 files to be read
+
+    None is returned for fc3 or fc2 that is not read from hdf5 file.
+
+    """
+
+    # The current directory is listed only when a default file name has
+    # to be looked for.
+    if ((fc3_filename is None and forces_fc3_filename is None) or
+        (fc2_filename is None and forces_fc2_filename is None)):
+        present = _get_file_names_in_current_directory()
+    else:
+        present = set()
+
+    _fc3_filename = None
     if fc3_filename is not None:
-        fc3 = read_fc3_from_hdf5(filename=fc3_filename, p2s_map=p2s_map)
-        ph3py.fc3 = fc3
+        _fc3_filename = fc3_filename
     elif forces_fc3_filename is not None:
         pass
-    elif os.path.isfile("fc3.hdf5"):
-        ph3py.fc3 = read_fc3_from_hdf5(filename="fc3.hdf5", p2s_map=p2s_map)
-    elif os.path.isfile("FORCES_FC3") and os.path.isfile("disp_fc3.yaml"):
+    elif "fc3.hdf5" in present:
+        _fc3_filename = "fc3.hdf5"
+    elif "FORCES_FC3" in present and "disp_fc3.yaml" in present:
         pass
 
+    _fc2_filename = None
     if fc2_filename is not None:
-        fc2 = read_fc2_from_hdf5(filename=fc2_filename, p2s_map=p2s_map)
-        ph3py.fc2 = fc2
+        _fc2_filename = fc2_filename
     elif forces_fc2_filename is not None:
         pass
-    elif os.path.isfile("fc2.hdf5"):
-        ph3py.fc2 = read_fc2_from_hdf5(filename="fc2.hdf5", p2s_map=p2s_map)
-    elif os.path.isfile("FORCES_FC2") and os.path.isfile("disp_fc2.yaml"):
+    elif "fc2.hdf5" in present:
+        _fc2_filename = "fc2.hdf5"
+    elif "FORCES_FC2" in present and "disp_fc2.yaml" in present:
+        pass
+
+    return _fc3_filename, _fc2_filename
+
+
+@lru_cache(maxsize=1)
+def _read_phono3py_yaml(filename, mtime_ns, size):
+    """Parse phono3py.yaml-like file
+
+    mtime_ns and size are used only as the cache key so that the file is
+    parsed again when it is modified.
+
+    """
+
+    ph3py_yaml = Phono3pyYaml()
+    ph3py_yaml.read(filename)
+    return ph3py_yaml
+
+
+def _stat_key(filename):
+    st = os.stat(filename)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_fc3_from_hdf5(filename, p2s_map, lazy=False, dtype='double'):
+    if not lazy:
+        _advise_sequential_read(filename)
+    return read_fc3_from_hdf5(filename=filename,
+                              p2s_map=p2s_map,
+                              lazy=lazy,
+                              dtype=dtype)
+
+
+def _read_fc3_and_fc2_from_hdf5(filename, p2s_map, lazy=False,
+                                dtype='double'):
+    """Read fc3 and fc2 from one hdf5 file
+
+    The file is opened only once unless fc2 has to be read by phonopy's
+    reader, see phono3py.file_IO._read_fc2_from_group.
+
+    """
+
+    if not lazy:
+        _advise_sequential_read(filename)
+    f = h5py.File(filename, 'r')
+    try:
+        fc3 = read_fc3_from_hdf5(filename=f,
+                                 p2s_map=p2s_map,
+                                 lazy=lazy,
+                                 dtype=dtype)
+        fc2 = read_fc2_from_hdf5(filename=f, p2s_map=p2s_map)
+    except Exception:
+        f.close()
+        raise
+    # File has to be kept open when fc3 is an h5py.Dataset.
+    if not isinstance(fc3, h5py.Dataset):
+        f.close()
+    return fc3, fc2
+
+
+def _advise_sequential_read(filename):
+    """Tell the kernel that the whole file will be read sequentially
+
+    This widens readahead and starts reading the file into page cache
+    before it is read through HDF5. Nothing is done where posix_fadvise
+    is unavailable. Advice values are not bit flags, so each is given
+    by a separate call.
+
+    """
+
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(filename, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
         pass
+    finally:
+        os.close(fd)
+
+
+def _get_file_names_in_current_directory():
+    """Return set of regular file names in the current directory
+
+    The directory is listed by a single os.scandir pass instead of
+    probing each candidate file by os.path.isfile.
+
+    """
+
+    return set(e.name for e in os.scandir('.') if e.is_file())
@@ -6,6 +6,7 @@ from phonopy.file_IO import (write_force_constants_to_hdf5,
                              check_force_constants_indices,
                              get_cell_from_disp_yaml)
 from phonopy.cui.load_helper import read_force_constants_from_hdf5
+from phonopy.interface.calculator import get_default_physical_units
 
 
 def write_cell_yaml(w, supercell):
@@ -241,22 +242,115 @@ def write_fc3_to_hdf5(fc3,
             w.create_dataset('p2s_map', data=p2s_map)
 
 
-def read_fc3_from_hdf5(filename='fc3.hdf5', p2s_map=None):
+def read_fc3_from_hdf5(filename='fc3.hdf5', p2s_map=None, lazy=False,
+                       dtype='double'):
+    """Read fc3 from hdf5 file
+
+    filename may be a file name or an already opened h5py.File (or
+    h5py.Group).
+
+    With lazy=True, fc3 is not read into memory. A read-only numpy.memmap
+    is returned when the dataset is stored contiguously without filters,
+    otherwise the h5py.Dataset itself is returned. In the latter case,
+    the file is kept open as long as the dataset is referenced, and the
+    dataset is opened with a chunk cache that holds the chunks of fc3[i].
+
+    dtype is the dtype of returned fc3. When it differs from that stored
+    in the file, e.g., dtype='single', data are converted by HDF5 while
+    reading. With lazy=True, dtype has to agree with the stored one since
+    the data are not converted, otherwise ValueError is raised.
+
+    """
+
+    if isinstance(filename, h5py.Group):
+        return _read_fc3_from_group(filename,
+                                    p2s_map=p2s_map,
+                                    filename=filename.file.filename,
+                                    lazy=lazy,
+                                    dtype=dtype)
+    if lazy:
+        f = h5py.File(filename, 'r')
+        try:
+            fc3 = _read_fc3_from_group(f,
+                                       p2s_map=p2s_map,
+                                       filename=filename,
+                                       lazy=True,
+                                       dtype=dtype)
+        except Exception:
+            f.close()
+            raise
+        if not isinstance(fc3, h5py.Dataset):
+            f.close()
+        return fc3
     with h5py.File(filename, 'r') as f:
-        fc3 = f['fc3'][:]
-        if 'p2s_map' in f:
-            p2s_map_in_file = f['p2s_map'][:]
-            check_force_constants_indices(fc3.shape[:2],
-                                          p2s_map_in_file,
-                                          p2s_map,
-                                          filename)
-        if fc3.dtype == np.double and fc3.flags.c_contiguous:
-            return fc3
-        else:
-            msg = ("%s has to be read by h5py as numpy ndarray of "
-                   "dtype='double' and c_contiguous." % filename)
-            raise TypeError(msg)
-    return None
+        return _read_fc3_from_group(f,
+                                    p2s_map=p2s_map,
+                                    filename=filename,
+                                    dtype=dtype)
+
+
+def _read_fc3_from_group(f, p2s_map=None, filename='fc3.hdf5', lazy=False,
+                         dtype='double'):
+    dset = f['fc3']
+
+    # Consistency with p2s_map is checked before reading fc3 data, which
+    # can be huge, only from the dataset shape.
+    if 'p2s_map' in f:
+        p2s_map_in_file = f['p2s_map'][:]
+        check_force_constants_indices(dset.shape[:2],
+                                      p2s_map_in_file,
+                                      p2s_map,
+                                      filename)
+
+    if lazy:
+        return _get_fc3_view(dset, dtype=dtype)
+
+    # Read into the array without creating an intermediate array.
+    fc3 = np.empty(dset.shape, dtype=dtype, order='C')
+    dset.read_direct(fc3)
+    return fc3
+
+
+def _get_fc3_view(dset, dtype='double'):
+    if dset.dtype != np.dtype(dtype):
+        msg = ("fc3 stored as dtype='%s' in %s can not be read lazily as "
+               "dtype='%s'." % (dset.dtype.name,
+                                dset.file.filename,
+                                np.dtype(dtype).name))
+        raise ValueError(msg)
+
+    # get_offset() returns None unless the dataset is contiguous and
+    # allocated. Contiguous datasets can not have filters, so the raw
+    # data in the file is the array itself.
+    offset = dset.id.get_offset()
+    if offset is not None:
+        return np.memmap(dset.file.filename,
+                         dtype=dset.dtype,
+                         mode='r',
+                         offset=offset,
+                         shape=dset.shape,
+                         order='C')
+    elif dset.chunks is not None:
+        return _open_with_chunk_cache(dset)
+    else:
+        return dset
+
+
+def _open_with_chunk_cache(dset, max_nbytes=256 * 1024 * 1024):
+    # The default chunk cache (1 MB) is too small to keep the chunks
+    # touched by fc3[i], so they would be read and decompressed again
+    # at every access of fc3[i, j]. The cache is sized to hold all
+    # chunks spanning dset.shape[1:], but at most max_nbytes.
+    n_chunks = int(np.prod([-(-n // c) for n, c in
+                            zip(dset.shape[1:], dset.chunks[1:])]))
+    chunk_nbytes = int(np.prod(dset.chunks)) * dset.dtype.itemsize
+    nbytes = min(n_chunks * chunk_nbytes, max_nbytes)
+    dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+    # HDF5 recommends about 100 times the number of cached chunks for
+    # the number of hash table slots.
+    dapl.set_chunk_cache(100 * n_chunks + 1, nbytes, 0.75)
+    dsid = h5py.h5d.open(dset.file.id, dset.name.encode('utf-8'), dapl)
+    return h5py.Dataset(dsid)
 
 
 def write_fc2_dat(force_constants, filename='fc2.dat'):
@@ -283,11 +377,58 @@ def write_fc2_to_hdf5(force_constants,
 
 def read_fc2_from_hdf5(filename='fc2.hdf5',
                        p2s_map=None):
+    """Read fc2 from hdf5 file
+
+    filename may be a file name or an already opened h5py.File (or
+    h5py.Group), e.g., a file that contains both fc3 and fc2.
+
+    """
+
+    if isinstance(filename, h5py.Group):
+        return _read_fc2_from_group(filename,
+                                    p2s_map=p2s_map,
+                                    filename=filename.file.filename)
     return read_force_constants_from_hdf5(filename=filename,
                                           p2s_map=p2s_map,
                                           calculator='vasp')
 
 
+def _read_fc2_from_group(f, p2s_map=None, filename='fc2.hdf5'):
+    """Read fc2 from opened hdf5 file
+
+    Only the layout written by write_fc2_to_hdf5, i.e., 'force_constants'
+    (and 'p2s_map') in eV/Angstrom^2 without 'fc2', is read here. This
+    has to be kept in sync with phonopy.file_IO.read_force_constants_hdf5.
+    Otherwise, e.g., when unit conversion is necessary, the file is read
+    again by phonopy's reader by its file name.
+
+    """
+
+    fc_unit = get_default_physical_units('vasp')['force_constants_unit']
+    physical_unit = fc_unit
+    if 'physical_unit' in f:
+        physical_unit = f['physical_unit'][0]
+        if isinstance(physical_unit, bytes):
+            physical_unit = physical_unit.decode('utf-8')
+
+    # phonopy reads 'fc2' prior to 'force_constants', and its unit
+    # conversion is case-sensitive.
+    if ('fc2' in f or
+        'force_constants' not in f or
+        physical_unit != fc_unit):
+        return read_force_constants_from_hdf5(filename=filename,
+                                              p2s_map=p2s_map,
+                                              calculator='vasp')
+
+    fc2 = f['force_constants'][:]
+    if 'p2s_map' in f:
+        check_force_constants_indices(fc2.shape[:2],
+                                      f['p2s_map'][:],
+                                      p2s_map,
+                                      filename)
+    return fc2
+
+
 def write_triplets(triplets,
                    weights,
                    mesh,
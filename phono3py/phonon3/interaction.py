@@ -392,8 +392,10 @@ class Interaction(object):
         elif self._frequency_scale_factor is None:
             self._fc3 = np.array(fc3, dtype='double', order='C')
         else:
-            self._fc3 = np.array(fc3 * self._frequency_scale_factor ** 2,
-                                 dtype='double', order='C')
+            # fc3 is converted to ndarray first since it may be array-like
+            # that has no arithmetic operations such as h5py.Dataset.
+            self._fc3 = np.array(fc3, dtype='double', order='C')
+            self._fc3 *= self._frequency_scale_factor ** 2
 
     def _set_band_indices(self, band_indices):
         num_band = self._primitive.get_number_of_atoms() * 3
@@ -0,0 +1,138 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+import h5py
+
+from phonopy.structure.atoms import PhonopyAtoms
+from phono3py import load
+from phono3py.cui.load import clear_load_cache
+from phono3py.file_IO import (write_fc3_to_hdf5, write_fc2_to_hdf5,
+                              read_fc3_from_hdf5)
+
+
+class TestLoad(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmpdir = tempfile.mkdtemp()
+        os.chdir(self._tmpdir)
+        self._cell = PhonopyAtoms(symbols=['Cs', 'Cl'],
+                                  cell=np.eye(3) * 4.1,
+                                  scaled_positions=[[0, 0, 0],
+                                                    [0.5, 0.5, 0.5]])
+        self._p2s_map = np.array([0, 1], dtype='intc')
+        rng = np.random.RandomState(0)
+        self._fc3 = rng.rand(2, 2, 2, 3, 3, 3)
+        self._fc2 = rng.rand(2, 2, 3, 3)
+
+    def tearDown(self):
+        clear_load_cache()
+        os.chdir(self._cwd)
+        shutil.rmtree(self._tmpdir)
+
+    def _load(self, fc3_filename='fc3.hdf5', fc2_filename='fc2.hdf5',
+              **kwargs):
+        return load(unitcell=self._cell,
+                    supercell_matrix=[1, 1, 1],
+                    primitive_matrix=np.eye(3),
+                    fc3_filename=fc3_filename,
+                    fc2_filename=fc2_filename,
+                    is_nac=False,
+                    **kwargs)
+
+    def _write_fc(self, compression=None):
+        write_fc3_to_hdf5(self._fc3,
+                          p2s_map=self._p2s_map,
+                          compression=compression)
+        write_fc2_to_hdf5(self._fc2,
+                          p2s_map=self._p2s_map,
+                          physical_unit='eV/Angstrom^2')
+
+    def test_read_fc3_dtype(self):
+        self._write_fc()
+        fc3 = read_fc3_from_hdf5(p2s_map=self._p2s_map, dtype='single')
+        self.assertEqual(fc3.dtype, np.dtype('single'))
+        np.testing.assert_allclose(fc3, self._fc3, rtol=1e-6)
+
+        ph3py = self._load(fc_dtype='single')
+        self.assertEqual(ph3py.fc3.dtype, np.dtype('single'))
+        self.assertRaises(TypeError, ph3py.set_permutation_symmetry)
+
+        # Stored dtype is not converted when read lazily.
+        self.assertRaises(ValueError,
+                          read_fc3_from_hdf5,
+                          p2s_map=self._p2s_map,
+                          lazy=True,
+                          dtype='single')
+        self.assertRaises(ValueError, self._load,
+                          lazy_fc=True,
+                          fc_dtype='single')
+
+    def test_read_fc3_lazy(self):
+        self._write_fc()
+        fc3 = read_fc3_from_hdf5(p2s_map=self._p2s_map, lazy=True)
+        self.assertTrue(isinstance(fc3, np.memmap))
+        self.assertEqual(fc3.dtype, np.dtype('double'))
+        np.testing.assert_allclose(fc3, self._fc3)
+        del fc3
+
+        # Compressed dataset is chunked.
+        self._write_fc(compression='gzip')
+        fc3 = read_fc3_from_hdf5(p2s_map=self._p2s_map, lazy=True)
+        self.assertTrue(isinstance(fc3, h5py.Dataset))
+        self.assertEqual(fc3.dtype, np.dtype('double'))
+        np.testing.assert_allclose(fc3[:], self._fc3)
+        fc3.file.close()
+
+        ph3py = self._load(lazy_fc=True)
+        self.assertRaises(TypeError, ph3py.set_translational_invariance)
+        ph3py.fc3.file.close()
+
+    def test_lazy_fc3_with_phph_interaction(self):
+        self._write_fc(compression='gzip')
+        ph3py = self._load(lazy_fc=True,
+                           mesh=[2, 2, 2],
+                           frequency_scale_factor=0.5)
+        self.assertTrue(isinstance(ph3py.fc3, h5py.Dataset))
+        fc3 = ph3py.get_phph_interaction().get_fc3()
+        self.assertTrue(isinstance(fc3, np.ndarray))
+        np.testing.assert_allclose(fc3, self._fc3 * 0.25)
+        ph3py.fc3.file.close()
+
+    def test_combined_file(self):
+        write_fc3_to_hdf5(self._fc3, filename='fc.hdf5',
+                          p2s_map=self._p2s_map)
+        with h5py.File('fc.hdf5', 'a') as w:
+            w.create_dataset('force_constants', data=self._fc2)
+            w.create_dataset('physical_unit', data=[b'eV/Angstrom^2'])
+        ph3py = self._load(fc3_filename='fc.hdf5', fc2_filename='fc.hdf5')
+        np.testing.assert_allclose(ph3py.fc3, self._fc3)
+        np.testing.assert_allclose(ph3py.fc2, self._fc2)
+
+    def test_use_cache(self):
+        self._write_fc()
+        ph3py_1 = self._load(use_cache=True)
+        ph3py_2 = self._load(use_cache=True, mesh=[2, 2, 2])
+        self.assertTrue(ph3py_1.fc3 is ph3py_2.fc3)
+        self.assertTrue(ph3py_1.mesh_numbers is None)
+        np.testing.assert_array_equal(ph3py_2.mesh_numbers, [2, 2, 2])
+
+        st = os.stat('fc3.hdf5')
+        os.utime('fc3.hdf5', ns=(st.st_atime_ns,
+                                 st.st_mtime_ns + 10 ** 9))
+        ph3py_3 = self._load(use_cache=True)
+        self.assertFalse(ph3py_1.fc3 is ph3py_3.fc3)
+        np.testing.assert_allclose(ph3py_3.fc3, self._fc3)
+
+        ph3py_4 = self._load()
+        self.assertFalse(ph3py_3.fc3 is ph3py_4.fc3)
+
+    def test_invalid_mesh(self):
+        # Raised before reading force constants files that do not exist.
+        self.assertRaises(TypeError, self._load, mesh=[2, 2])
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestLoad)
+    unittest.TextTestRunner(verbosity=2).run(suite)